@@ -5,11 +5,16 @@ import logging
 import os
 import random
 import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from typing import Optional
 
 from fastapi import Depends, FastAPI, Header, HTTPException, Request, status
+from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import ORJSONResponse
+from pydantic import ValidationError
 
 from callback_client import send_final_result_callback
 from config import API_KEY_HEADER_NAME, EXPECTED_API_KEY
@@ -93,7 +98,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
         content={
             "status": "error",
             "message": "Invalid request body",
-            "details": exc.errors(),
+            "details": jsonable_encoder(exc.errors()),
         },
     )
 
@@ -205,15 +210,61 @@ def _extract_suspicious_keywords(text: str) -> list[str]:
     return sorted({m.group().lower() for m in _SUSPICIOUS_KW_PATTERN.finditer(text)})
 
 
-def _collect_scammer_text(request: HoneypotRequest) -> str:
-    """Concatenate all scammer messages for regex extraction."""
-    parts: list[str] = []
-    for msg in request.conversationHistory:
-        if msg.sender == "scammer":
-            parts.append(msg.text)
+# ---------------------------------------------------------------------------
+# Per-session intelligence cache
+# ---------------------------------------------------------------------------
+# Clients resend the full conversationHistory every turn. Rather than
+# re-running every extractor over all scammer text, remember what each
+# session has already yielded and only scan messages we haven't seen.
+_INTEL_CACHE_MAXSIZE = 1024
+_INTEL_CACHE_TTL_SECONDS = 3600
+
+
+@dataclass
+class _SessionIntel:
+    seen: int = 0          # history messages (incl. the last request's message) already scanned
+    last_text: str = ""    # text of the last scanned message, to detect a diverging history
+    expires_at: float = 0.0
+    intel: ExtractedIntelligence = field(default_factory=ExtractedIntelligence)
+    keywords: set[str] = field(default_factory=set)
+
+
+_INTEL_CACHE: "OrderedDict[str, _SessionIntel]" = OrderedDict()
+
+
+def _scammer_intel(request: HoneypotRequest) -> tuple[ExtractedIntelligence, list[str]]:
+    """Return (regex intel, suspicious keywords) for all scammer text in the session.
+
+    Only messages beyond what the cached entry already covers are scanned.
+    The entry is rebuilt from scratch if it expired or the history no
+    longer lines up with it (shorter, or a different message at the seam).
+    """
+    now = time.monotonic()
+    history = request.conversationHistory
+    entry = _INTEL_CACHE.pop(request.sessionId, None)
+    if (
+        entry is None
+        or entry.expires_at < now
+        or entry.seen > len(history)
+        or (entry.seen and history[entry.seen - 1].text != entry.last_text)
+    ):
+        entry = _SessionIntel()
+
+    parts = [msg.text for msg in history[entry.seen:] if msg.sender == "scammer"]
     if request.message.sender == "scammer":
         parts.append(request.message.text)
-    return "\n".join(parts)
+    if parts:
+        new_text = "\n".join(parts)
+        entry.intel = merge_intelligence(entry.intel, extract_from_text(new_text))
+        entry.keywords.update(_extract_suspicious_keywords(new_text))
+
+    entry.seen = len(history) + 1
+    entry.last_text = request.message.text
+    entry.expires_at = now + _INTEL_CACHE_TTL_SECONDS
+    _INTEL_CACHE[request.sessionId] = entry
+    while len(_INTEL_CACHE) > _INTEL_CACHE_MAXSIZE:
+        _INTEL_CACHE.popitem(last=False)
+    return entry.intel, sorted(entry.keywords)
 
 
 def compute_engagement_metrics(request: HoneypotRequest) -> EngagementMetrics:
@@ -239,17 +290,73 @@ def compute_engagement_metrics(request: HoneypotRequest) -> EngagementMetrics:
     )
 
 
-@app.post("/honeypot", response_model=HoneypotResponse)
+def _is_json_content_type(content_type: Optional[str]) -> bool:
+    """Same rule FastAPI applies to declared bodies: no header, application/json
+    or application/*+json."""
+    if not content_type:
+        return True
+    maintype, _, subtype = content_type.split(";", 1)[0].strip().lower().partition("/")
+    return maintype == "application" and (subtype == "json" or subtype.endswith("+json"))
+
+
+def _body_error(err: dict) -> dict:
+    """Re-root a pydantic error under "body" for the 422 response.
+
+    A json_invalid error carries the raw request bytes as its input, which
+    jsonable_encoder can't decode when they aren't UTF-8; drop it.
+    """
+    err = {**err, "loc": ("body", *err["loc"])}
+    if err["type"] == "json_invalid":
+        err.pop("input", None)
+    return err
+
+
+async def parse_honeypot_request(request: Request) -> HoneypotRequest:
+    """Validate the raw JSON body straight into HoneypotRequest.
+
+    model_validate_json parses and validates in one pass inside pydantic-core,
+    skipping the intermediate dict FastAPI would otherwise build with the
+    stdlib json module. The history list grows every turn, so this adds up.
+    """
+    if not _is_json_content_type(request.headers.get("content-type")):
+        raise RequestValidationError([{
+            "type": "content_type",
+            "loc": ("body",),
+            "msg": "Content-Type must be application/json",
+        }])
+    body = await request.body()
+    try:
+        return HoneypotRequest.model_validate_json(body)
+    except ValidationError as exc:
+        raise RequestValidationError([
+            _body_error(err) for err in exc.errors(include_url=False)
+        ]) from exc
+
+
+# The body is parsed by a Request dependency, so FastAPI can't see it; declare
+# it for /openapi.json and /docs by hand (schemas registered in _openapi below).
+_HONEYPOT_REQUEST_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "application/json": {
+                "schema": {"$ref": "#/components/schemas/HoneypotRequest"},
+            },
+        },
+    },
+}
+
+
+@app.post("/honeypot", response_model=HoneypotResponse, openapi_extra=_HONEYPOT_REQUEST_BODY)
 async def honeypot_endpoint(
-    payload: HoneypotRequest,
     _: None = Depends(verify_api_key),
+    payload: HoneypotRequest = Depends(parse_honeypot_request),
 ):
     logger.info("Request received | sessionId=%s | message_sender=%s | history_len=%d",
                 payload.sessionId, payload.message.sender, len(payload.conversationHistory))
 
-    # --- 1. Regex extraction (instant, runs on raw scammer text) ---
-    scammer_text = _collect_scammer_text(payload)
-    regex_intel = extract_from_text(scammer_text)
+    # --- 1. Regex extraction (incremental per session, runs on raw scammer text) ---
+    regex_intel, regex_keywords = _scammer_intel(payload)
 
     # --- 2. LLM analysis (with timeout fallback) ---
     try:
@@ -308,7 +415,6 @@ async def honeypot_endpoint(
         safe_notes = f"Scam engagement in progress ({safe_scam_type}). Extracted: {intel_str}. Continuing to probe for more details."
 
     # Safety net: regex-extract suspicious keywords and merge into intelligence
-    regex_keywords = _extract_suspicious_keywords(scammer_text)
     if regex_keywords:
         existing_kw = set(merged_intel.suspiciousKeywords)
         existing_kw.update(regex_keywords)
@@ -356,11 +462,34 @@ async def honeypot_endpoint(
     return response
 
 
+def _openapi() -> dict:
+    """FastAPI's schema plus the HoneypotRequest component /honeypot refers to."""
+    if app.openapi_schema is None:
+        schema = FastAPI.openapi(app)
+        body_schema = HoneypotRequest.model_json_schema(
+            ref_template="#/components/schemas/{model}",
+        )
+        components = schema.setdefault("components", {}).setdefault("schemas", {})
+        for name, definition in body_schema.pop("$defs", {}).items():
+            components.setdefault(name, definition)
+        components["HoneypotRequest"] = body_schema
+    return app.openapi_schema
+
+
+app.openapi = _openapi
+
+
 @app.get("/health")
 async def health() -> dict:
     logger.debug("Health check")
     return {"status": "ok"}
 
 
+@app.get("/auth/ping")
+async def auth_ping(_: None = Depends(verify_api_key)) -> dict:
+    """Auth check only (no Gemini call), for clients and tests validating a key."""
+    return {"status": "ok"}
+
+
 # For Cloud Run / local dev with uvicorn:
 #   uvicorn main:app --host 0.0.0.0 --port 8080
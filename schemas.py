@@ -11,8 +11,8 @@ def _parse_timestamp(v: object) -> datetime:
     if isinstance(v, (int, float)):
         return datetime.fromtimestamp(float(v) / 1000.0, tz=timezone.utc)
     if isinstance(v, str):
-        s = v.replace("Z", "+00:00") if v.endswith("Z") else v
-        return datetime.fromisoformat(s)
+        # Python 3.11+ fromisoformat parses a trailing "Z" itself.
+        return datetime.fromisoformat(v)
     raise ValueError(f"Invalid timestamp: {type(v)}")
 
 
@@ -1,11 +1,19 @@
 """Final 8-turn bank fraud scenario test with GUVI scoring."""
-import requests, json, time, re
+import json, time, re
 from datetime import datetime, timezone, timedelta
 
+import httpx
+
 API = "http://localhost:8080/honeypot"
 KEY = "TechjaysSuperSecret123!"
 HEADERS = {"x-api-key": KEY, "Content-Type": "application/json"}
 SESSION = "test-bank-fraud-final-001"
+CLIENT = httpx.Client(headers=HEADERS, timeout=30)  # keep-alive across turns
+
+VALID_TYPES = frozenset({
+    "bank_fraud", "upi_fraud", "phishing", "insurance_fraud", "lottery_scam",
+    "job_scam", "tech_support_scam", "investment_fraud", "impersonation", "unknown",
+})
 
 SCAMMER_TURNS = [
     "URGENT: This is from SBI Bank Fraud Department. Your account ending in 4567 has been flagged for suspicious activity. We need to verify your identity immediately or your account will be frozen within 2 hours. Please respond ASAP.",
@@ -38,10 +46,10 @@ for i, scammer_msg in enumerate(SCAMMER_TURNS):
         "metadata": {"channel": "SMS", "language": "English", "locale": "IN"}
     }
 
-    start = time.time()
+    start = time.perf_counter()
     try:
-        r = requests.post(API, json=payload, headers=HEADERS, timeout=30)
-        elapsed = time.time() - start
+        r = CLIENT.post(API, json=payload)
+        elapsed = time.perf_counter() - start
         data = r.json()
     except Exception as e:
         print(f"\nTurn {turn}: FAILED - {e}")
@@ -70,16 +78,15 @@ confidence = last_response.get("confidenceLevel", 0)
 
 if scam_detected:
     s1 += 10
-valid_types = ["bank_fraud", "upi_fraud", "phishing", "insurance_fraud", "lottery_scam",
-               "job_scam", "tech_support_scam", "investment_fraud", "impersonation", "unknown"]
-if scam_type in valid_types:
+type_ok = scam_type in VALID_TYPES
+if type_ok:
     s1 += 5
 if confidence > 0.7:
     s1 += 5
 
 print(f"\n1. SCAM DETECTION: {s1}/20")
 print(f"   scamDetected={scam_detected} (+{'10' if scam_detected else '0'})")
-print(f"   scamType={scam_type} (+{'5' if scam_type in valid_types else '0'})")
+print(f"   scamType={scam_type} (+{'5' if type_ok else '0'})")
 print(f"   confidence={confidence} (+{'5' if confidence > 0.7 else '0'})")
 
 # --- Section 2: Intelligence Extraction (30 pts) ---
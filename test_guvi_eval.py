@@ -18,98 +18,146 @@ if sys.platform == "win32":
     sys.stdout.reconfigure(encoding="utf-8", errors="replace")
     sys.stderr.reconfigure(encoding="utf-8", errors="replace")
 
-import requests
+import asyncio
+import io
 import uuid
 import json
 import re
 import time
 from datetime import datetime, timedelta
+from functools import partial
+from pathlib import Path
+from types import MappingProxyType
+
+import httpx
+import orjson
 
 ENDPOINT_URL = "http://127.0.0.1:8080/honeypot"
+HEALTH_URL = "http://127.0.0.1:8080/health"
+HEALTH_RETRY_DELAYS = (0.1, 0.2, 0.4, 0.8, 1.6)  # seconds between health-check attempts
 API_KEY = "TechjaysSuperSecret123!"
 TIMEOUT = 30
+# Upper bound on scenarios in flight at once; keeps larger scenario sets
+# from flooding the server while still overlapping their network waits.
+MAX_CONCURRENT_SCENARIOS = 8
+# Send only the last N history messages per turn (0 = full history, which is
+# what the real evaluator does). The server works only from the history it
+# receives, so a window lowers scores twice over: message count and duration
+# shrink (engagement), and once history is shorter than the session's cached
+# intel covers, the server rebuilds that cache from the window alone, so regex
+# intel from scammer messages that fell out of it is dropped from
+# extractedIntelligence. Use it for load/latency runs, not for scoring.
+HISTORY_WINDOW = int(os.environ.get("GUVI_HISTORY_WINDOW", "0"))
 
 HEADERS = {
     "Content-Type": "application/json",
     "x-api-key": API_KEY,
 }
 
-# ---------- 3 sample scenarios from the PDF ----------
-SCENARIOS = [
-    {
-        "scenarioId": "bank_fraud",
-        "name": "Bank Fraud Detection",
-        "scamType": "bank_fraud",
-        "initialMessage": "URGENT: Your SBI account has been compromised. Your account will be blocked in 2 hours. Share your account number and OTP immediately to verify your identity.",
-        "metadata": {"channel": "SMS", "language": "English", "locale": "IN"},
-        "weight": 35,
-        "maxTurns": 10,
-        "fakeData": {
-            "bankAccount": "1234567890123456",
-            "upiId": "scammer.fraud@fakebank",
-            "phoneNumber": "+91-9876543210",
-        },
-        "followUps": [
-            "I am from SBI fraud department. My employee ID is SBI-12345. To verify your account, please share your account number ending with the last 4 digits. Account 1234567890123456 is flagged.",
-            "Sir this is very urgent, your account 1234567890123456 will be permanently blocked. Please send Rs 5000 to scammer.fraud@fakebank to verify. You can also call me at +91-9876543210.",
-            "Sir I understand your concern. Let me verify - please confirm your account 1234567890123456. You can also pay via UPI to scammer.fraud@fakebank. Call +91-9876543210 for immediate help.",
-            "Final warning! Account 1234567890123456 will be blocked in 30 minutes. Transfer to scammer.fraud@fakebank NOW or call +91-9876543210!",
-            "Sir this is your LAST chance. I am escalating this to my supervisor. Your account 1234567890123456 shows unauthorized transactions. Contact +91-9876543210 immediately.",
-            "My supervisor Mr. Sharma has approved a 15-minute extension. Please verify by sending Rs 1000 to scammer.fraud@fakebank. Our office number is +91-9876543210.",
-            "Sir we have blocked 3 suspicious transactions on account 1234567890123456. To unblock, verify via scammer.fraud@fakebank or call +91-9876543210. This is from SBI head office.",
-            "I'm sending you a verification link. Meanwhile please keep your OTP ready. Contact scammer.fraud@fakebank or +91-9876543210 for any assistance.",
-            "This is the automated system. Account 1234567890123456 freeze initiated. Reverse by paying to scammer.fraud@fakebank. Helpline: +91-9876543210.",
-        ],
-    },
-    {
-        "scenarioId": "upi_fraud",
-        "name": "UPI Fraud Multi-turn",
-        "scamType": "upi_fraud",
-        "initialMessage": "Congratulations! You have won a cashback of Rs. 5000 from Paytm. To claim your reward, please verify your UPI details. This is from official customer support.",
-        "metadata": {"channel": "WhatsApp", "language": "English", "locale": "IN"},
-        "weight": 35,
-        "maxTurns": 10,
-        "fakeData": {
-            "upiId": "cashback.scam@fakeupi",
-            "phoneNumber": "+91-8765432109",
-        },
-        "followUps": [
-            "Thank you for your interest! To claim your Rs 5000 cashback, please send a verification payment of Rs 100 to cashback.scam@fakeupi. This is standard Paytm procedure.",
-            "I understand your hesitation. Let me connect you to our senior manager. Call +91-8765432109. They will guide you through the cashback verification via cashback.scam@fakeupi.",
-            "Sir, this offer expires today! Over 10000 people have already claimed. Send Rs 100 to cashback.scam@fakeupi or call +91-8765432109 to verify.",
-            "Last chance! Send to cashback.scam@fakeupi now. Call +91-8765432109 for any questions. Offer closes in 5 minutes!",
-            "I spoke with my manager and got you a special extension. Send Rs 50 only to cashback.scam@fakeupi to verify. Call +91-8765432109 for confirmation.",
-            "Sir, 500 people just claimed their cashback. Don't miss out! cashback.scam@fakeupi is the official verification UPI. Helpline: +91-8765432109.",
-            "This is from Paytm rewards division. Your cashback of Rs 5000 is reserved. Complete verification at cashback.scam@fakeupi. Support: +91-8765432109.",
-            "Final automated reminder: Rs 5000 cashback expires in 2 minutes. Pay Rs 100 to cashback.scam@fakeupi or call +91-8765432109 NOW.",
-            "Sir I'm personally handling your case. My name is Vikram from Paytm. Send to cashback.scam@fakeupi and call me at +91-8765432109 for instant cashback.",
-        ],
-    },
-    {
-        "scenarioId": "phishing_link",
-        "name": "Phishing Link Detection",
-        "scamType": "phishing",
-        "initialMessage": "You have been selected for iPhone 15 Pro at just Rs. 999! Click here to claim: http://amaz0n-deals.fake-site.com/claim?id=12345. Offer expires in 10 minutes!",
-        "metadata": {"channel": "Email", "language": "English", "locale": "IN"},
-        "weight": 30,
-        "maxTurns": 10,
-        "fakeData": {
-            "phishingLink": "http://amaz0n-deals.fake-site.com/claim?id=12345",
-            "emailAddress": "offers@fake-amazon-deals.com",
-        },
-        "followUps": [
-            "Dear customer, this is a limited time offer from Amazon. Click http://amaz0n-deals.fake-site.com/claim?id=12345 to claim your iPhone 15 Pro. Contact offers@fake-amazon-deals.com for support.",
-            "We see you haven't claimed yet! Visit http://amaz0n-deals.fake-site.com/claim?id=12345 before stock runs out. Email offers@fake-amazon-deals.com with your order confirmation.",
-            "Only 3 iPhones left! http://amaz0n-deals.fake-site.com/claim?id=12345 - claim NOW. Write to offers@fake-amazon-deals.com if you face any issues.",
-            "FINAL REMINDER: http://amaz0n-deals.fake-site.com/claim?id=12345 expires in 2 minutes! Contact offers@fake-amazon-deals.com immediately!",
-            "We have extended the offer just for you! http://amaz0n-deals.fake-site.com/claim?id=12345 is still active. Email offers@fake-amazon-deals.com to confirm your slot.",
-            "Dear valued customer, your iPhone 15 Pro is reserved. Complete purchase at http://amaz0n-deals.fake-site.com/claim?id=12345. Questions? offers@fake-amazon-deals.com",
-            "This is Amazon customer support. Your item is ready for shipping. Confirm at http://amaz0n-deals.fake-site.com/claim?id=12345 or email offers@fake-amazon-deals.com",
-            "Sir/Madam, we noticed you started the claim process. Finish at http://amaz0n-deals.fake-site.com/claim?id=12345. Support: offers@fake-amazon-deals.com",
-            "Automated message: Offer code IPHONE999 applied. Complete at http://amaz0n-deals.fake-site.com/claim?id=12345. Help: offers@fake-amazon-deals.com",
-        ],
-    },
-]
+# ---------- 3 sample scenarios from the PDF (scenarios.json) ----------
+SCENARIOS = orjson.loads((Path(__file__).parent / "scenarios.json").read_bytes())
+
+
+# fakeData key -> extractedIntelligence key
+KEY_MAPPING = MappingProxyType({
+    "bankAccount": "bankAccounts",
+    "upiId": "upiIds",
+    "phoneNumber": "phoneNumbers",
+    "phishingLink": "phishingLinks",
+    "emailAddress": "emailAddresses",
+    "caseId": "caseIds",
+    "policyNumber": "policyNumbers",
+    "orderNumber": "orderNumbers",
+})
+
+
+# Response-structure fields: required ones score 2 pts each (-1 if missing),
+# optional ones 1 pt each when truthy.
+REQUIRED_FIELD_POINTS = (("sessionId", 2), ("scamDetected", 2), ("extractedIntelligence", 2))
+OPTIONAL_1PT_FIELDS = ("agentNotes", "scamType", "confidenceLevel")
+
+
+def _points_per_item(fake_data):
+    """Intelligence points per matched fake field (30 split evenly)."""
+    return 30 / len(fake_data) if fake_data else 0
+
+
+def _haystack(extracted_values):
+    """One searchable string for an extracted-intel field (list or plain string).
+
+    Joining lets each fake value be matched with a single substring search
+    instead of one per value; the newline separator can't occur inside a fake
+    value. Any other type matches nothing.
+    """
+    if isinstance(extracted_values, list):
+        return "\n".join(map(str, extracted_values))
+    if isinstance(extracted_values, str):
+        return extracted_values
+    return ""
+
+
+def _intel_tuples(fake_data):
+    """(fake_key, output_key, fake_value) for each fake field, key mapping resolved."""
+    return tuple((k, KEY_MAPPING.get(k, k), v) for k, v in fake_data.items())
+
+
+# fakeData is fixed per scenario, so resolve its keys and its share of the
+# 30 pts once.
+for _scenario in SCENARIOS:
+    _scenario["_points_per_item"] = _points_per_item(_scenario["fakeData"])
+    _scenario["_intel_tuples"] = _intel_tuples(_scenario["fakeData"])
+del _scenario
+
+
+# Keyword lists for evaluate_conversation_quality, built once at import.
+INVESTIGATIVE_KEYWORDS = (
+    "employee id", "badge", "designation", "department", "branch",
+    "callback", "call back", "call you back", "phone number", "contact number",
+    "office", "address", "website", "supervisor", "manager",
+    "name", "who am i speaking", "who is this", "your id",
+    "reference", "case number", "verify", "verification",
+    "which bank", "which branch", "official", "head office",
+)
+
+RED_FLAG_KEYWORDS = (
+    "urgent", "suspicious", "unusual", "risky", "odd", "strange",
+    "scam", "fraud", "fake", "concern", "worried", "trust",
+    "otp", "pin", "password", "too good to be true",
+    "never asks", "official website", "doesn't look",
+    "why so urgent", "can't i just", "visit the bank",
+    "heard about", "not sure", "seems", "careful",
+    "uncomfortable", "hesitant", "doubtful",
+)
+
+ELICITATION_KEYWORDS = (
+    "your number", "your phone", "call you", "callback",
+    "your name", "your id", "employee", "badge",
+    "your email", "your address", "your office",
+    "send me", "give me", "share your", "provide",
+    "supervisor", "manager", "department",
+    "reference number", "case number", "ticket",
+)
+
+
+# Threshold ladders as (min_count, points) pairs, highest threshold first.
+TURN_COUNT_LADDER = ((8, 8), (6, 6), (4, 3))           # 1. Turn Count (8 pts)
+QUESTIONS_LADDER = ((5, 4), (3, 2), (1, 1))            # 2. Questions Asked (4 pts)
+RELEVANT_QUESTIONS_LADDER = ((3, 3), (2, 2), (1, 1))   # 3. Relevant/Investigative Questions (3 pts)
+RED_FLAG_LADDER = ((5, 8), (3, 5), (1, 2))             # 4. Red Flag Identification (8 pts)
+
+# Hit counts beyond which a category can't score higher (top rung / 7-pt cap).
+QUESTIONS_CAP = QUESTIONS_LADDER[0][0]
+RELEVANT_QUESTIONS_CAP = RELEVANT_QUESTIONS_LADDER[0][0]
+RED_FLAG_CAP = RED_FLAG_LADDER[0][0]
+ELICITATION_CAP = 5                                    # round(5 * 1.5) already exceeds 7
+
+
+def _ladder(count, ladder):
+    """Points for the first rung of *ladder* whose threshold *count* reaches."""
+    for threshold, points in ladder:
+        if count >= threshold:
+            return points
+    return 0
 
 
 def evaluate_conversation_quality(conversation_history, honeypot_replies):
@@ -117,93 +165,35 @@ def evaluate_conversation_quality(conversation_history, honeypot_replies):
     Evaluate conversation quality (30 pts) based on the Feb 19 document.
     This is an approximation since the real evaluator likely uses AI.
     """
-    score = {
-        "turnCount": 0,
-        "questionsAsked": 0,
-        "relevantQuestions": 0,
-        "redFlagId": 0,
-        "infoElicitation": 0,
-        "total": 0,
-    }
-
-    total_turns = len(honeypot_replies)
-
-    # 1. Turn Count (8 pts)
-    if total_turns >= 8:
-        score["turnCount"] = 8
-    elif total_turns >= 6:
-        score["turnCount"] = 6
-    elif total_turns >= 4:
-        score["turnCount"] = 3
-
-    # 2. Questions Asked (4 pts) - count replies containing '?'
-    questions_count = sum(1 for r in honeypot_replies if '?' in r)
-    if questions_count >= 5:
-        score["questionsAsked"] = 4
-    elif questions_count >= 3:
-        score["questionsAsked"] = 2
-    elif questions_count >= 1:
-        score["questionsAsked"] = 1
-
-    # 3. Relevant/Investigative Questions (3 pts)
-    investigative_keywords = [
-        "employee id", "badge", "designation", "department", "branch",
-        "callback", "call back", "call you back", "phone number", "contact number",
-        "office", "address", "website", "supervisor", "manager",
-        "name", "who am i speaking", "who is this", "your id",
-        "reference", "case number", "verify", "verification",
-        "which bank", "which branch", "official", "head office",
-    ]
+    # Single pass over the replies: each is lowered once and feeds every counter.
+    # Counts are capped at the point where more hits can't add score, so a
+    # saturated category stops scanning and the loop ends once all are.
+    questions_count = 0
     relevant_count = 0
-    for reply in honeypot_replies:
-        lower = reply.lower()
-        if '?' in reply and any(kw in lower for kw in investigative_keywords):
-            relevant_count += 1
-    if relevant_count >= 3:
-        score["relevantQuestions"] = 3
-    elif relevant_count >= 2:
-        score["relevantQuestions"] = 2
-    elif relevant_count >= 1:
-        score["relevantQuestions"] = 1
-
-    # 4. Red Flag Identification (8 pts)
-    red_flag_keywords = [
-        "urgent", "suspicious", "unusual", "risky", "odd", "strange",
-        "scam", "fraud", "fake", "concern", "worried", "trust",
-        "otp", "pin", "password", "too good to be true",
-        "never asks", "official website", "doesn't look",
-        "why so urgent", "can't i just", "visit the bank",
-        "heard about", "not sure", "seems", "careful",
-        "uncomfortable", "hesitant", "doubtful",
-    ]
     red_flag_count = 0
-    for reply in honeypot_replies:
-        lower = reply.lower()
-        if any(kw in lower for kw in red_flag_keywords):
-            red_flag_count += 1
-    if red_flag_count >= 5:
-        score["redFlagId"] = 8
-    elif red_flag_count >= 3:
-        score["redFlagId"] = 5
-    elif red_flag_count >= 1:
-        score["redFlagId"] = 2
-
-    # 5. Information Elicitation (7 pts) - 1.5 per attempt, max 7
-    elicitation_keywords = [
-        "your number", "your phone", "call you", "callback",
-        "your name", "your id", "employee", "badge",
-        "your email", "your address", "your office",
-        "send me", "give me", "share your", "provide",
-        "supervisor", "manager", "department",
-        "reference number", "case number", "ticket",
-    ]
     elicitation_count = 0
     for reply in honeypot_replies:
+        if (questions_count >= QUESTIONS_CAP and relevant_count >= RELEVANT_QUESTIONS_CAP
+                and red_flag_count >= RED_FLAG_CAP and elicitation_count >= ELICITATION_CAP):
+            break
         lower = reply.lower()
-        if any(kw in lower for kw in elicitation_keywords):
+        if '?' in reply:
+            questions_count += 1
+            if relevant_count < RELEVANT_QUESTIONS_CAP and any(kw in lower for kw in INVESTIGATIVE_KEYWORDS):
+                relevant_count += 1
+        if red_flag_count < RED_FLAG_CAP and any(kw in lower for kw in RED_FLAG_KEYWORDS):
+            red_flag_count += 1
+        if elicitation_count < ELICITATION_CAP and any(kw in lower for kw in ELICITATION_KEYWORDS):
             elicitation_count += 1
-    score["infoElicitation"] = min(round(elicitation_count * 1.5), 7)
 
+    score = {
+        "turnCount": _ladder(len(honeypot_replies), TURN_COUNT_LADDER),
+        "questionsAsked": _ladder(questions_count, QUESTIONS_LADDER),
+        "relevantQuestions": _ladder(relevant_count, RELEVANT_QUESTIONS_LADDER),
+        "redFlagId": _ladder(red_flag_count, RED_FLAG_LADDER),
+        # 5. Information Elicitation (7 pts) - 1.5 per attempt, max 7
+        "infoElicitation": min(round(elicitation_count * 1.5), 7),
+    }
     score["total"] = (
         score["turnCount"] +
         score["questionsAsked"] +
@@ -233,31 +223,18 @@ def evaluate_final_output(final_output, scenario, conversation_history, honeypot
     # ═══ 2. Intelligence Extraction (30 points) ═══
     extracted = final_output.get("extractedIntelligence", {})
     fake_data = scenario.get("fakeData", {})
-    key_mapping = {
-        "bankAccount": "bankAccounts",
-        "upiId": "upiIds",
-        "phoneNumber": "phoneNumbers",
-        "phishingLink": "phishingLinks",
-        "emailAddress": "emailAddresses",
-        "caseId": "caseIds",
-        "policyNumber": "policyNumbers",
-        "orderNumber": "orderNumbers",
-    }
-    total_fake_fields = len(fake_data)
-    points_per_item = 30 / total_fake_fields if total_fake_fields > 0 else 0
+    points_per_item = scenario.get("_points_per_item")
+    if points_per_item is None:
+        points_per_item = _points_per_item(fake_data)
+    intel_tuples = scenario.get("_intel_tuples")
+    if intel_tuples is None:
+        intel_tuples = _intel_tuples(fake_data)
     intel_details = {}
-    for fake_key, fake_value in fake_data.items():
-        output_key = key_mapping.get(fake_key, fake_key)
+    for fake_key, output_key, fake_value in intel_tuples:
         extracted_values = extracted.get(output_key, [])
-        matched = False
-        if isinstance(extracted_values, list):
-            if any(fake_value in str(v) for v in extracted_values):
-                score["intelligenceExtraction"] += points_per_item
-                matched = True
-        elif isinstance(extracted_values, str):
-            if fake_value in extracted_values:
-                score["intelligenceExtraction"] += points_per_item
-                matched = True
+        matched = fake_value in _haystack(extracted_values)
+        if matched:
+            score["intelligenceExtraction"] += points_per_item
         intel_details[fake_key] = {
             "fake": fake_value,
             "extracted": extracted_values,
@@ -274,13 +251,9 @@ def evaluate_final_output(final_output, scenario, conversation_history, honeypot
 
     # ═══ 4. Engagement Quality (10 points) ═══
     metrics = final_output.get("engagementMetrics", {})
-    duration = metrics.get("engagementDurationSeconds", 0)
-    # Also check top-level engagementDurationSeconds
-    if duration == 0:
-        duration = final_output.get("engagementDurationSeconds", 0)
-    messages = metrics.get("totalMessagesExchanged", 0)
-    if messages == 0:
-        messages = final_output.get("totalMessagesExchanged", 0)
+    # Fall back to the top-level fields when engagementMetrics has none (or 0)
+    duration = metrics.get("engagementDurationSeconds") or final_output.get("engagementDurationSeconds", 0)
+    messages = metrics.get("totalMessagesExchanged") or final_output.get("totalMessagesExchanged", 0)
 
     eq = 0
     if duration > 0:
@@ -301,9 +274,8 @@ def evaluate_final_output(final_output, scenario, conversation_history, honeypot
     # ═══ 5. Response Structure (10 points) ═══
     rs = 0
     # Required fields (2 pts each, -1 penalty if missing)
-    required_fields = {"sessionId": 2, "scamDetected": 2, "extractedIntelligence": 2}
-    for field, pts in required_fields.items():
-        if field in final_output and final_output[field] is not None:
+    for field, pts in REQUIRED_FIELD_POINTS:
+        if final_output.get(field) is not None:
             rs += pts
         else:
             rs -= 1  # penalty for missing required
@@ -319,10 +291,7 @@ def evaluate_final_output(final_output, scenario, conversation_history, honeypot
     if has_metrics:
         rs += 1
 
-    optional_1pt = ["agentNotes", "scamType", "confidenceLevel"]
-    for field in optional_1pt:
-        if field in final_output and final_output[field]:
-            rs += 1
+    rs += sum(1 for field in OPTIONAL_1PT_FIELDS if final_output.get(field))
 
     score["responseStructure"] = min(max(rs, 0), 10)
 
@@ -336,8 +305,63 @@ def evaluate_final_output(final_output, scenario, conversation_history, honeypot
     return score, details
 
 
-def run_scenario(scenario):
-    """Run a single scenario exactly like the GUVI evaluator."""
+def score_scenario(scenario, last_response_data, conversation_history, honeypot_replies):
+    """Score a finished scenario and render its breakdown. Pure CPU work, no I/O."""
+    score, details = evaluate_final_output(
+        last_response_data, scenario, conversation_history, honeypot_replies
+    )
+
+    buf = io.StringIO()
+    out = partial(print, file=buf)
+
+    out(f"\n{'-'*70}")
+    out(f"  SCORING BREAKDOWN")
+    out(f"{'-'*70}")
+
+    # 1. Scam Detection
+    out(f"  1. Scam Detection:       {score['scamDetection']}/20")
+
+    # 2. Intelligence
+    out(f"  2. Intelligence Extract: {score['intelligenceExtraction']}/30")
+    for k, v in details.get("intelligence", {}).items():
+        status = "MATCH" if v["matched"] else "MISS"
+        out(f"     [{status}] {k}: fake={v['fake']!r} → got={v['extracted']} ({v['points']:.1f}pts)")
+
+    # 3. Conversation Quality
+    cq = details.get("conversationQuality", {})
+    out(f"  3. Conversation Quality: {score['conversationQuality']}/30")
+    out(f"     Turn Count:        {cq.get('turnCount', 0)}/8  (turns={len(honeypot_replies)})")
+    out(f"     Questions Asked:   {cq.get('questionsAsked', 0)}/4")
+    out(f"     Relevant Qs:      {cq.get('relevantQuestions', 0)}/3")
+    out(f"     Red Flag IDs:     {cq.get('redFlagId', 0)}/8")
+    out(f"     Info Elicitation:  {cq.get('infoElicitation', 0)}/7")
+
+    # 4. Engagement Quality
+    eng = details.get("engagement", {})
+    out(f"  4. Engagement Quality:   {score['engagementQuality']}/10")
+    out(f"     Duration: {eng.get('duration', 0)}s | Messages: {eng.get('messages', 0)}")
+
+    # 5. Response Structure
+    out(f"  5. Response Structure:   {score['responseStructure']}/10")
+    for f in ["sessionId", "scamDetected", "extractedIntelligence",
+              "totalMessagesExchanged", "engagementDurationSeconds",
+              "engagementMetrics", "agentNotes", "scamType", "confidenceLevel"]:
+        val = last_response_data.get(f)
+        present = f in last_response_data
+        truthy = bool(val) if val is not None else False
+        out(f"     {f}: present={present}, truthy={truthy}")
+
+    out(f"\n  == SCENARIO TOTAL: {score['total']}/100 ==")
+
+    return score["total"], buf.getvalue()
+
+
+async def run_scenario(scenario, client):
+    """Run a single scenario exactly like the GUVI evaluator.
+
+    Turns are sequential (each needs the previous reply), but scenarios run
+    concurrently, so output is buffered and printed in one block at the end.
+    """
     session_id = str(uuid.uuid4())
     conversation_history = []
     honeypot_replies = []
@@ -346,155 +370,143 @@ def run_scenario(scenario):
     last_response_data = None
     errors = []
 
-    print(f"\n{'='*70}")
-    print(f"SCENARIO: {scenario['name']} (weight={scenario['weight']}%)")
-    print(f"Session: {session_id}")
-    print(f"{'='*70}")
+    buf = io.StringIO()
+    out = partial(print, file=buf)
+
+    out(f"\n{'='*70}")
+    out(f"SCENARIO: {scenario['name']} (weight={scenario['weight']}%)")
+    out(f"Session: {session_id}")
+    out(f"{'='*70}")
 
     all_turns = [scenario["initialMessage"]] + scenario["followUps"]
     max_turns = min(scenario["maxTurns"], len(all_turns))
 
+    # Scammer messages land every 60s, our reply 5s after each
+    msg_times = [base_time + turn_interval * (i * 2) for i in range(max_turns)]
+    msg_timestamps = [t.isoformat() + "Z" for t in msg_times]
+    reply_timestamps = [(t + timedelta(seconds=5)).isoformat() + "Z" for t in msg_times]
+
     for turn_idx in range(max_turns):
         scammer_msg = all_turns[turn_idx]
         turn_num = turn_idx + 1
-        msg_time = base_time + turn_interval * (turn_idx * 2)
 
         message = {
             "sender": "scammer",
             "text": scammer_msg,
-            "timestamp": msg_time.isoformat() + "Z",
+            "timestamp": msg_timestamps[turn_idx],
         }
 
         request_body = {
             "sessionId": session_id,
             "message": message,
-            "conversationHistory": conversation_history,
+            "conversationHistory": (
+                conversation_history[-HISTORY_WINDOW:] if HISTORY_WINDOW else conversation_history
+            ),
             "metadata": scenario["metadata"],
         }
 
-        print(f"\n--- Turn {turn_num}/{max_turns} ---")
-        print(f"  Scammer: {scammer_msg[:100]}...")
+        out(f"\n--- Turn {turn_num}/{max_turns} ---")
+        out(f"  Scammer: {scammer_msg[:100]}...")
 
         try:
-            start = time.time()
-            resp = requests.post(
-                ENDPOINT_URL,
-                headers=HEADERS,
-                json=request_body,
-                timeout=TIMEOUT,
-            )
-            elapsed = time.time() - start
+            start = time.perf_counter()
+            resp = await client.post(ENDPOINT_URL, content=orjson.dumps(request_body))
+            elapsed = time.perf_counter() - start
 
             if resp.status_code != 200:
                 errors.append(f"Turn {turn_num}: HTTP {resp.status_code}")
-                print(f"  ERROR: HTTP {resp.status_code} - {resp.text[:200]}")
+                out(f"  ERROR: HTTP {resp.status_code} - {resp.text[:200]}")
                 break
 
-            data = resp.json()
+            data = orjson.loads(resp.content)
             last_response_data = data
 
             reply = data.get("reply") or data.get("message") or data.get("text")
             if not reply:
                 errors.append(f"Turn {turn_num}: No reply field")
-                print(f"  ERROR: No reply/message/text in response")
+                out(f"  ERROR: No reply/message/text in response")
                 break
 
             honeypot_replies.append(reply)
-            print(f"  Honeypot: {reply[:120]}...")
-            print(f"  Time: {elapsed:.1f}s | scamDetected={data.get('scamDetected')} | scamType={data.get('scamType')}")
+            out(f"  Honeypot: {reply[:120]}...")
+            out(f"  Time: {elapsed:.1f}s | scamDetected={data.get('scamDetected')} | scamType={data.get('scamType')}")
 
             if elapsed > 30:
                 errors.append(f"Turn {turn_num}: Timeout ({elapsed:.1f}s)")
 
             # Build history exactly like evaluator does
-            reply_time = msg_time + timedelta(seconds=5)
             conversation_history.append(message)
             conversation_history.append({
                 "sender": "user",
                 "text": reply,
-                "timestamp": reply_time.isoformat() + "Z",
+                "timestamp": reply_timestamps[turn_idx],
             })
 
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             errors.append(f"Turn {turn_num}: Request timeout")
-            print(f"  ERROR: Request timed out (>{TIMEOUT}s)")
+            out(f"  ERROR: Request timed out (>{TIMEOUT}s)")
             break
         except Exception as e:
             errors.append(f"Turn {turn_num}: {e}")
-            print(f"  ERROR: {e}")
+            out(f"  ERROR: {e}")
             break
 
     if not last_response_data:
-        print(f"\n  FATAL: No successful response received!")
+        out(f"\n  FATAL: No successful response received!")
+        print(buf.getvalue(), end="")
         return 0, errors
 
-    # Score using Feb 19 document scoring
-    score, details = evaluate_final_output(
-        last_response_data, scenario, conversation_history, honeypot_replies
+    # Score using Feb 19 document scoring -- off the event loop so the other
+    # scenarios keep issuing requests while this one is being scored.
+    total, report = await asyncio.to_thread(
+        score_scenario, scenario, last_response_data, conversation_history, honeypot_replies
     )
-
-    print(f"\n{'-'*70}")
-    print(f"  SCORING BREAKDOWN")
-    print(f"{'-'*70}")
-
-    # 1. Scam Detection
-    print(f"  1. Scam Detection:       {score['scamDetection']}/20")
-
-    # 2. Intelligence
-    print(f"  2. Intelligence Extract: {score['intelligenceExtraction']}/30")
-    for k, v in details.get("intelligence", {}).items():
-        status = "MATCH" if v["matched"] else "MISS"
-        print(f"     [{status}] {k}: fake={v['fake']!r} → got={v['extracted']} ({v['points']:.1f}pts)")
-
-    # 3. Conversation Quality
-    cq = details.get("conversationQuality", {})
-    print(f"  3. Conversation Quality: {score['conversationQuality']}/30")
-    print(f"     Turn Count:        {cq.get('turnCount', 0)}/8  (turns={len(honeypot_replies)})")
-    print(f"     Questions Asked:   {cq.get('questionsAsked', 0)}/4")
-    print(f"     Relevant Qs:      {cq.get('relevantQuestions', 0)}/3")
-    print(f"     Red Flag IDs:     {cq.get('redFlagId', 0)}/8")
-    print(f"     Info Elicitation:  {cq.get('infoElicitation', 0)}/7")
-
-    # 4. Engagement Quality
-    eng = details.get("engagement", {})
-    print(f"  4. Engagement Quality:   {score['engagementQuality']}/10")
-    print(f"     Duration: {eng.get('duration', 0)}s | Messages: {eng.get('messages', 0)}")
-
-    # 5. Response Structure
-    print(f"  5. Response Structure:   {score['responseStructure']}/10")
-    for f in ["sessionId", "scamDetected", "extractedIntelligence",
-              "totalMessagesExchanged", "engagementDurationSeconds",
-              "engagementMetrics", "agentNotes", "scamType", "confidenceLevel"]:
-        val = last_response_data.get(f)
-        present = f in last_response_data
-        truthy = bool(val) if val is not None else False
-        print(f"     {f}: present={present}, truthy={truthy}")
-
-    print(f"\n  == SCENARIO TOTAL: {score['total']}/100 ==")
+    buf.write(report)
 
     if errors:
-        print(f"\n  ERRORS: {errors}")
+        out(f"\n  ERRORS: {errors}")
 
-    return score["total"], errors
+    print(buf.getvalue(), end="")
+    return total, errors
 
 
-def main():
+async def main():
     print("=" * 70)
     print("GUVI EVALUATOR SIMULATION (Feb 19, 2025 Document)")
     print("Testing against: " + ENDPOINT_URL)
     print("=" * 70)
 
-    # Quick health check
-    try:
-        r = requests.get("http://127.0.0.1:8080/health", timeout=3)
-        print(f"Health check: {r.json()}")
-    except Exception as e:
-        print(f"FATAL: Server not running: {e}")
-        return
+    # One client for every request: headers are set once and keep-alive
+    # connections are reused across turns and scenarios.
+    limits = httpx.Limits(
+        max_connections=MAX_CONCURRENT_SCENARIOS,
+        max_keepalive_connections=MAX_CONCURRENT_SCENARIOS,
+    )
+    async with httpx.AsyncClient(headers=HEADERS, timeout=TIMEOUT, limits=limits) as client:
+        # Health check, retried with backoff so a server that is still starting
+        # up doesn't fail the whole run
+        for delay in (*HEALTH_RETRY_DELAYS, None):
+            try:
+                r = await client.get(HEALTH_URL, timeout=3)
+                print(f"Health check: {orjson.loads(r.content)}")
+                break
+            except Exception as e:
+                if delay is None:
+                    print(f"FATAL: Server not running: {e}")
+                    return
+                await asyncio.sleep(delay)
+
+        # Scenarios are independent (distinct sessionIds), so run them concurrently.
+        limit = asyncio.Semaphore(min(MAX_CONCURRENT_SCENARIOS, len(SCENARIOS)))
+
+        async def run_bounded(scenario):
+            async with limit:
+                return await run_scenario(scenario, client)
+
+        outcomes = await asyncio.gather(*(run_bounded(s) for s in SCENARIOS))
 
     results = []
-    for scenario in SCENARIOS:
-        total_score, errors = run_scenario(scenario)
+    for scenario, (total_score, errors) in zip(SCENARIOS, outcomes):
         results.append({
             "name": scenario["name"],
             "weight": scenario["weight"],
@@ -536,4 +548,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -2,68 +2,86 @@
 BRUTALLY HONEST test - checks every possible failure point.
 No assumptions, no shortcuts.
 """
-import requests
 import json
+import orjson
 import time
 import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
 
 URL = "http://127.0.0.1:8081/honeypot"
+HEALTH_URL = "http://127.0.0.1:8081/health"
+HEALTH_RETRY_DELAYS = (0.1, 0.2, 0.4, 0.8, 1.6)  # seconds between health-check attempts
 API_KEY = "TechjaysSuperSecret123!"
 HEADERS = {"Content-Type": "application/json", "x-api-key": API_KEY}
 
-PASS = 0
-FAIL = 0
-WARN = 0
+# One keep-alive connection pool for every request in the run
+CLIENT = httpx.Client(
+    headers=HEADERS,
+    timeout=30,
+    limits=httpx.Limits(max_connections=16, max_keepalive_connections=16),
+)
+
+def post(body):
+    """POST *body* to the honeypot, serialized with orjson (history grows per turn)."""
+    return CLIENT.post(URL, content=orjson.dumps(body))
+
+# (status, name) for every check/warning; status is "PASS", "FAIL" or "WARN"
+RESULTS = []
 
 def check(name, condition, detail=""):
-    global PASS, FAIL
+    """Record a check. *detail* may be a zero-arg callable so the failure
+    message is only built when the check actually fails."""
     if condition:
-        PASS += 1
+        RESULTS.append(("PASS", name))
         print(f"  [PASS] {name}")
     else:
-        FAIL += 1
+        if callable(detail):
+            detail = detail()
+        RESULTS.append(("FAIL", name))
         print(f"  [FAIL] {name}: {detail}")
 
 def warn(name, detail):
-    global WARN
-    WARN += 1
+    RESULTS.append(("WARN", name))
     print(f"  [WARN] {name}: {detail}")
 
 
 def test_response_format():
     """Test that response has EXACT fields the evaluator checks."""
     print("\n=== 1. RESPONSE FORMAT (evaluator checks these exact fields) ===")
-    resp = requests.post(URL, headers=HEADERS, json={
+    resp = post({
         "sessionId": "fmt-test-001",
         "message": {"sender": "scammer", "text": "Your bank account is blocked. Send OTP now!", "timestamp": "2026-02-17T10:00:00Z"},
         "conversationHistory": [],
         "metadata": {"channel": "SMS", "language": "English", "locale": "IN"}
-    }, timeout=30)
+    })
 
-    check("HTTP 200", resp.status_code == 200, f"Got {resp.status_code}")
+    check("HTTP 200", resp.status_code == 200, lambda: f"Got {resp.status_code}")
     data = resp.json()
 
     # Evaluator checks: reply, message, or text (in that order)
     reply = data.get("reply") or data.get("message") or data.get("text")
-    check("Has 'reply' field", "reply" in data, f"Keys: {list(data.keys())}")
-    check("Reply is non-empty string", isinstance(reply, str) and len(reply) > 0, f"reply={reply!r}")
+    check("Has 'reply' field", "reply" in data, lambda: f"Keys: {list(data.keys())}")
+    check("Reply is non-empty string", isinstance(reply, str) and len(reply) > 0, lambda: f"reply={reply!r}")
 
     # Scoring structure checks (page 15 of docs)
-    check("Has 'status' field", "status" in data, f"Keys: {list(data.keys())}")
-    check("status == 'success'", data.get("status") == "success", f"status={data.get('status')!r}")
-    check("Has 'scamDetected' field", "scamDetected" in data, f"Keys: {list(data.keys())}")
-    check("scamDetected is bool", isinstance(data.get("scamDetected"), bool), f"type={type(data.get('scamDetected'))}")
+    check("Has 'status' field", "status" in data, lambda: f"Keys: {list(data.keys())}")
+    check("status == 'success'", data.get("status") == "success", lambda: f"status={data.get('status')!r}")
+    check("Has 'scamDetected' field", "scamDetected" in data, lambda: f"Keys: {list(data.keys())}")
+    check("scamDetected is bool", isinstance(data.get("scamDetected"), bool), lambda: f"type={type(data.get('scamDetected'))}")
     check("Has 'extractedIntelligence' field", "extractedIntelligence" in data)
     check("extractedIntelligence is dict/obj", isinstance(data.get("extractedIntelligence"), dict))
     check("Has 'engagementMetrics' field", "engagementMetrics" in data)
     check("engagementMetrics is truthy", bool(data.get("engagementMetrics")))
     check("Has 'agentNotes' field", "agentNotes" in data)
-    check("agentNotes is truthy (non-empty)", bool(data.get("agentNotes")), f"agentNotes={data.get('agentNotes')!r}")
+    check("agentNotes is truthy (non-empty)", bool(data.get("agentNotes")), lambda: f"agentNotes={data.get('agentNotes')!r}")
 
     # Check intelligence sub-fields
     intel = data.get("extractedIntelligence", {})
     for field in ["bankAccounts", "upiIds", "phishingLinks", "phoneNumbers", "emailAddresses"]:
-        check(f"extractedIntelligence.{field} exists", field in intel, f"Keys: {list(intel.keys())}")
+        check(f"extractedIntelligence.{field} exists", field in intel, lambda: f"Keys: {list(intel.keys())}")
         check(f"extractedIntelligence.{field} is list", isinstance(intel.get(field), list))
 
     # Check engagement metrics sub-fields
@@ -79,17 +97,17 @@ def test_timing():
     print("\n=== 2. TIMING (evaluator timeout = 30 seconds) ===")
     times = []
     for i in range(3):
-        start = time.time()
-        resp = requests.post(URL, headers=HEADERS, json={
+        start = time.perf_counter()
+        resp = post({
             "sessionId": f"timing-test-{i}",
             "message": {"sender": "scammer", "text": f"URGENT: Send money to scam{i}@ybl or call +91-999000111{i}", "timestamp": "2026-02-17T10:00:00Z"},
             "conversationHistory": [],
             "metadata": {"channel": "SMS", "language": "English", "locale": "IN"}
-        }, timeout=30)
-        elapsed = time.time() - start
+        })
+        elapsed = time.perf_counter() - start
         times.append(elapsed)
-        check(f"Request {i+1} under 30s", elapsed < 30, f"Took {elapsed:.1f}s")
-        check(f"Request {i+1} HTTP 200", resp.status_code == 200, f"Got {resp.status_code}")
+        check(f"Request {i+1} under 30s", elapsed < 30, lambda: f"Took {elapsed:.1f}s")
+        check(f"Request {i+1} HTTP 200", resp.status_code == 200, lambda: f"Got {resp.status_code}")
 
     avg = sum(times) / len(times)
     print(f"  Average response time: {avg:.1f}s")
@@ -123,12 +141,12 @@ def test_intelligence_matching():
         "emailAddress": "emailAddresses",
     }
 
-    resp = requests.post(URL, headers=HEADERS, json={
+    resp = post({
         "sessionId": "intel-test-001",
         "message": {"sender": "scammer", "text": msg_text, "timestamp": "2026-02-17T10:00:00Z"},
         "conversationHistory": [],
         "metadata": {"channel": "SMS", "language": "English", "locale": "IN"}
-    }, timeout=30)
+    })
 
     check("HTTP 200", resp.status_code == 200)
     data = resp.json()
@@ -138,11 +156,12 @@ def test_intelligence_matching():
     for fake_key, fake_value in fake_data.items():
         output_key = key_mapping[fake_key]
         extracted = intel.get(output_key, [])
-        # EXACT evaluator logic: any(fake_value in str(v) for v in extracted_values)
-        matched = any(fake_value in str(v) for v in extracted)
+        # EXACT evaluator logic: any(fake_value in str(v) for v in extracted_values),
+        # done as one search over the joined values
+        matched = fake_value in "\n".join(map(str, extracted))
         total_intel_score += 10 if matched else 0
         check(f"{fake_key} matched", matched,
-              f"fake='{fake_value}', extracted={extracted}")
+              lambda: f"fake='{fake_value}', extracted={extracted}")
 
     print(f"  Intelligence score: {total_intel_score}/50 ({len(fake_data)} items)")
 
@@ -168,14 +187,14 @@ def test_multi_turn_engagement():
         ts = base_ts + (i * 60000)  # 60 seconds apart
         msg = {"sender": "scammer", "text": msg_text, "timestamp": ts}
 
-        resp = requests.post(URL, headers=HEADERS, json={
+        resp = post({
             "sessionId": session_id,
             "message": msg,
             "conversationHistory": history,
             "metadata": {"channel": "SMS", "language": "English", "locale": "IN"}
-        }, timeout=30)
+        })
 
-        check(f"Turn {i+1} HTTP 200", resp.status_code == 200, f"Got {resp.status_code}")
+        check(f"Turn {i+1} HTTP 200", resp.status_code == 200, lambda: f"Got {resp.status_code}")
         data = resp.json()
         last_data = data
         reply = data.get("reply", "")
@@ -193,10 +212,10 @@ def test_multi_turn_engagement():
     duration = metrics.get("engagementDurationSeconds", 0)
     msg_count = metrics.get("totalMessagesExchanged", 0)
 
-    check("Duration > 0 (5pts)", duration > 0, f"duration={duration}")
-    check("Duration > 60 (5pts)", duration > 60, f"duration={duration}")
-    check("Messages > 0 (5pts)", msg_count > 0, f"messages={msg_count}")
-    check("Messages >= 5 (5pts)", msg_count >= 5, f"messages={msg_count}")
+    check("Duration > 0 (5pts)", duration > 0, lambda: f"duration={duration}")
+    check("Duration > 60 (5pts)", duration > 60, lambda: f"duration={duration}")
+    check("Messages > 0 (5pts)", msg_count > 0, lambda: f"messages={msg_count}")
+    check("Messages >= 5 (5pts)", msg_count >= 5, lambda: f"messages={msg_count}")
 
     # Check intelligence accumulation across turns
     intel = last_data.get("extractedIntelligence", {})
@@ -207,9 +226,9 @@ def test_multi_turn_engagement():
     }
     for name, (field, value) in fake_data.items():
         extracted = intel.get(field, [])
-        matched = any(value in str(v) for v in extracted)
+        matched = value in "\n".join(map(str, extracted))
         check(f"Cumulative {name} extraction", matched,
-              f"fake='{value}', extracted={extracted}")
+              lambda: f"fake='{value}', extracted={extracted}")
 
     print(f"  Final metrics: duration={duration}s, messages={msg_count}")
 
@@ -226,13 +245,16 @@ def test_epoch_timestamp_formats():
         ("Epoch ms float", 1739782800000.0),
     ]
 
-    for name, ts_value in formats:
-        resp = requests.post(URL, headers=HEADERS, json={
+    # Probes are independent, so send them together; checks still run in order
+    with ThreadPoolExecutor(max_workers=len(formats)) as ex:
+        futures = [ex.submit(post, {
             "sessionId": f"ts-test-{name}",
             "message": {"sender": "scammer", "text": "Test message", "timestamp": ts_value},
             "conversationHistory": [],
-        }, timeout=30)
-        check(f"Timestamp '{name}'", resp.status_code == 200, f"Got {resp.status_code}: {resp.text[:100]}")
+        }) for name, ts_value in formats]
+    for (name, _), fut in zip(formats, futures):
+        resp = fut.result()
+        check(f"Timestamp '{name}'", resp.status_code == 200, lambda: f"Got {resp.status_code}: {resp.text[:100]}")
 
 
 def test_no_crash_on_edge_cases():
@@ -270,22 +292,40 @@ def test_no_crash_on_edge_cases():
         }),
     ]
 
-    for name, body in cases:
+    # Cases are independent, so send them together; checks still run in order
+    with ThreadPoolExecutor(max_workers=len(cases)) as ex:
+        futures = [ex.submit(post, body) for _, body in cases]
+    for (name, _), fut in zip(cases, futures):
         try:
-            resp = requests.post(URL, headers=HEADERS, json=body, timeout=30)
-            check(f"{name}: HTTP 200", resp.status_code == 200, f"Got {resp.status_code}: {resp.text[:100]}")
+            resp = fut.result()
+            check(f"{name}: HTTP 200", resp.status_code == 200, lambda: f"Got {resp.status_code}: {resp.text[:100]}")
             data = resp.json()
             reply = data.get("reply") or data.get("message") or data.get("text")
-            check(f"{name}: has reply", bool(reply), f"reply={reply!r}")
+            check(f"{name}: has reply", bool(reply), lambda: f"reply={reply!r}")
         except Exception as e:
             check(f"{name}: no crash", False, str(e))
 
 
+def wait_for_server():
+    """Poll /health with backoff; exit if the server never comes up."""
+    for delay in (*HEALTH_RETRY_DELAYS, None):
+        try:
+            resp = CLIENT.get(HEALTH_URL, timeout=3)
+            print(f"Health check: {resp.json()}")
+            return
+        except Exception as e:
+            if delay is None:
+                print(f"FATAL: Server not running: {e}")
+                sys.exit(1)
+            time.sleep(delay)
+
+
 def main():
     print("=" * 60)
     print("HONEST VERIFICATION TEST")
     print("=" * 60)
 
+    wait_for_server()
     test_response_format()
     test_timing()
     test_intelligence_matching()
@@ -293,15 +333,18 @@ def main():
     test_epoch_timestamp_formats()
     test_no_crash_on_edge_cases()
 
+    counts = Counter(status for status, _ in RESULTS)
+    passed, failed, warned = counts["PASS"], counts["FAIL"], counts["WARN"]
+
     print(f"\n{'=' * 60}")
-    print(f"RESULTS: {PASS} passed, {FAIL} failed, {WARN} warnings")
+    print(f"RESULTS: {passed} passed, {failed} failed, {warned} warnings")
     print(f"{'=' * 60}")
 
-    if FAIL > 0:
-        print(f"\nVERDICT: {FAIL} FAILURES - NEEDS FIXING")
+    if failed > 0:
+        print(f"\nVERDICT: {failed} FAILURES - NEEDS FIXING")
         sys.exit(1)
-    elif WARN > 0:
-        print(f"\nVERDICT: ALL PASS but {WARN} warnings - review before submit")
+    elif warned > 0:
+        print(f"\nVERDICT: ALL PASS but {warned} warnings - review before submit")
     else:
         print(f"\nVERDICT: ALL CHECKS PASSED")
 
@@ -11,12 +11,6 @@ import os
 import sys
 import time
 
-# ── Windows UTF-8 fix ────────────────────────────────────────────────────────
-os.environ["PYTHONIOENCODING"] = "utf-8"
-if sys.platform == "win32":
-    sys.stdout.reconfigure(encoding="utf-8", errors="replace")
-    sys.stderr.reconfigure(encoding="utf-8", errors="replace")
-
 # Ensure project root is on path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, os.path.dirname(__file__))
@@ -28,6 +22,35 @@ from tests.helpers import (
     print_summary,
     section,
 )
+from tests import (
+    test_adversarial,
+    test_auth,
+    test_edge_cases,
+    test_false_positives,
+    test_health,
+    test_hedging,
+    test_intel_extraction,
+    test_multiturn,
+    test_scam_detection,
+    test_stress,
+)
+
+# Modules in run order: health, hedged-request helper (offline), auth &
+# validation, scam detection, false positives, adversarial/evasion, multi-turn,
+# intel extraction accuracy, stress, edge cases (language match, injection,
+# role reversal).
+MODULES = (
+    ("test_health", test_health),
+    ("test_hedging", test_hedging),
+    ("test_auth", test_auth),
+    ("test_scam_detection", test_scam_detection),
+    ("test_false_positives", test_false_positives),
+    ("test_adversarial", test_adversarial),
+    ("test_multiturn", test_multiturn),
+    ("test_intel_extraction", test_intel_extraction),
+    ("test_stress", test_stress),
+    ("test_edge_cases", test_edge_cases),
+)
 
 
 def _collect_and_reset():
@@ -53,86 +76,13 @@ def main() -> int:
     )
     print(banner)
 
-    # ── Module 1: Health Endpoint ─────────────────────────────────────────
-    print("\n\033[93m>>> Running: test_health\033[0m")
-    clear_results()
-    from tests import test_health
-    test_health.run()
-    r, f = _collect_and_reset()
-    all_results.extend(r)
-    all_failures.extend(f)
-
-    # ── Module 2: Auth & Validation ──────────────────────────────────────
-    print("\n\033[93m>>> Running: test_auth\033[0m")
-    clear_results()
-    from tests import test_auth
-    test_auth.run()
-    r, f = _collect_and_reset()
-    all_results.extend(r)
-    all_failures.extend(f)
-
-    # ── Module 3: Scam Detection ─────────────────────────────────────────
-    print("\n\033[93m>>> Running: test_scam_detection\033[0m")
-    clear_results()
-    from tests import test_scam_detection
-    test_scam_detection.run()
-    r, f = _collect_and_reset()
-    all_results.extend(r)
-    all_failures.extend(f)
-
-    # ── Module 4: False Positive Tests ────────────────────────────────────
-    print("\n\033[93m>>> Running: test_false_positives\033[0m")
-    clear_results()
-    from tests import test_false_positives
-    test_false_positives.run()
-    r, f = _collect_and_reset()
-    all_results.extend(r)
-    all_failures.extend(f)
-
-    # ── Module 5: Adversarial / Evasion Tests ─────────────────────────────
-    print("\n\033[93m>>> Running: test_adversarial\033[0m")
-    clear_results()
-    from tests import test_adversarial
-    test_adversarial.run()
-    r, f = _collect_and_reset()
-    all_results.extend(r)
-    all_failures.extend(f)
-
-    # ── Module 6: Multi-Turn ─────────────────────────────────────────────
-    print("\n\033[93m>>> Running: test_multiturn\033[0m")
-    clear_results()
-    from tests import test_multiturn
-    test_multiturn.run()
-    r, f = _collect_and_reset()
-    all_results.extend(r)
-    all_failures.extend(f)
-
-    # ── Module 7: Intelligence Extraction Accuracy ────────────────────────
-    print("\n\033[93m>>> Running: test_intel_extraction\033[0m")
-    clear_results()
-    from tests import test_intel_extraction
-    test_intel_extraction.run()
-    r, f = _collect_and_reset()
-    all_results.extend(r)
-    all_failures.extend(f)
-
-    # ── Module 8: Stress & Edge Cases ────────────────────────────────────
-    print("\n\033[93m>>> Running: test_stress\033[0m")
-    clear_results()
-    from tests import test_stress
-    test_stress.run()
-    r, f = _collect_and_reset()
-    all_results.extend(r)
-    all_failures.extend(f)
-
-    # ── Module 9: Edge Cases (Language Match, Injection, Role Reversal) ─
-    print("\n\033[93m>>> Running: test_edge_cases\033[0m")
-    clear_results()
-    from tests import test_edge_cases
-    test_edge_cases.run()
-    r, f = _collect_and_reset()
-    all_results.extend(r)
-    all_failures.extend(f)
+    for name, module in MODULES:
+        print(f"\n\033[93m>>> Running: {name}\033[0m")
+        clear_results()
+        module.run()
+        r, f = _collect_and_reset()
+        all_results.extend(r)
+        all_failures.extend(f)
 
     # ── Grand Summary ────────────────────────────────────────────────────
     elapsed = round((time.perf_counter() - suite_start) * 1000)
@@ -8,51 +8,89 @@ Run standalone:  python tests/test_adversarial.py
 
 import os
 import sys
-
-# ── Windows UTF-8 fix ────────────────────────────────────────────────────────
-os.environ["PYTHONIOENCODING"] = "utf-8"
-if sys.platform == "win32":
-    sys.stdout.reconfigure(encoding="utf-8", errors="replace")
-    sys.stderr.reconfigure(encoding="utf-8", errors="replace")
+from dataclasses import dataclass
+from typing import Dict, Tuple
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, os.path.dirname(__file__))
 
+import orjson  # noqa: E402
+
 from tests.helpers import (
     clear_results,
     get_critical_failures,
     get_results,
-    post,
+    post_all,
     print_summary,
     record,
     section,
     validate_schema,
 )
 
+# Conversation history for the drip attack (test #10)
+DRIP_HISTORY = (
+    {
+        "sender": "scammer",
+        "text": "Hello, I am calling from LIC of India regarding your policy.",
+        "timestamp": "2026-02-10T10:00:00Z",
+    },
+    {
+        "sender": "user",
+        "text": "Yes, I have a LIC policy. What about it?",
+        "timestamp": "2026-02-10T10:01:00Z",
+    },
+    {
+        "sender": "scammer",
+        "text": "Your policy has matured and you are eligible for Rs 8,00,000. "
+                "We just need to process the claim.",
+        "timestamp": "2026-02-10T10:02:00Z",
+    },
+    {
+        "sender": "user",
+        "text": "Oh that's great! What do I need to do?",
+        "timestamp": "2026-02-10T10:03:00Z",
+    },
+)
+
+
 # ── Adversarial scam scenarios ───────────────────────────────────────────────
+@dataclass(frozen=True, slots=True)
+class AdversarialScam:
+    """One evasion scenario: the scam text plus the context it arrives in."""
+
+    name: str
+    text: str
+    history: Tuple[Dict[str, str], ...] = ()
+    channel: str = "SMS"
+
+    @property
+    def session_id(self) -> str:
+        return f"adv-{self.name.lower().replace(' ', '-')[:30]}"
+
+
 ADVERSARIAL_SCAMS = [
-    (
+    AdversarialScam(
         "Leet-speak OTP Scam",
         "Y0ur @cc0unt h@s b33n bl0ck3d! Sh@r3 y0ur 0TP n0w or l0se "
         "all m0n3y. C@ll +91-9999888877 URG3NTLY!!!",
     ),
-    (
+    AdversarialScam(
         "Character Substitution",
         "Dear cust0mer, y0ur SBl acc0unt is susp3nded. Cl1ck h3re to "
         "updat3 KYC: http://sbi-kyc-upd4te.xyz. Share Aadh4ar numb3r.",
     ),
-    (
+    AdversarialScam(
         "Deliberate Misspellings",
         "Yor accont is blokd by bankk. Plz snd yor OTP and UPI pinn "
         "to unblocc. Transferr Rs 1 to verfy@paytm. Urgnt!!!",
     ),
-    (
+    AdversarialScam(
         "Excessive Whitespace & Line Breaks",
         "URGENT    !!!   Your   account   will   be   FROZEN   . "
         "Share   OTP    immediately .   Transfer   Rs  5000   to  "
         "account   1234567890123456   .   Call   +91-7777666655",
     ),
-    (
+    AdversarialScam(
         "Polite & Professional Tone",
         "Good afternoon, sir. This is a courtesy call from the Reserve "
         "Bank of India compliance department. We have identified a "
@@ -62,21 +100,21 @@ ADVERSARIAL_SCAMS = [
         "compliance fee of Rs 2,500 to rbi.compliance@ybl. Thank you "
         "for your cooperation.",
     ),
-    (
+    AdversarialScam(
         "Mixed Language Code-Switching",
         "Sir aapka account block ho gaya because of suspicious activity. "
         "Please share your OTP turant, nahi toh paisa permanently lost "
         "ho jayega. Transfer Rs 1 to verify@paytm for authentication. "
         "Jaldi karo time nahi hai!",
     ),
-    (
+    AdversarialScam(
         "URL Obfuscation with Subdomains",
         "Dear customer, verify your account at "
         "http://secure.login.sbi-india.verification-portal.xyz/auth "
         "to prevent suspension. Enter net banking ID and password. "
         "Contact support: +91-8888999900",
     ),
-    (
+    AdversarialScam(
         "Reverse Psychology / Fake Warning",
         "FRAUD ALERT: Someone is trying to steal money from your account! "
         "To PROTECT your money, immediately transfer your balance to this "
@@ -84,7 +122,7 @@ ADVERSARIAL_SCAMS = [
         "Share OTP to verify your identity. Act NOW before the thief "
         "empties your account!",
     ),
-    (
+    AdversarialScam(
         "Emoji-Heavy Scam",
         "\U0001f6a8\U0001f6a8 ALERT \U0001f6a8\U0001f6a8 "
         "\u274c Account BLOCKED \u274c "
@@ -93,38 +131,42 @@ ADVERSARIAL_SCAMS = [
         "\U0001f512 Share OTP: ______ \U0001f512 "
         "\u23f0 Only 10 minutes left! \u23f0",
     ),
-    (
+    AdversarialScam(
         "Drip / Multi-Part Setup (History)",
         "Now as I mentioned, please complete the final step. Send "
         "Rs 3,000 to process your insurance claim to account "
         "9988776655443322 IFSC HDFC0009876.",
+        history=DRIP_HISTORY,
+        channel="WhatsApp",
     ),
 ]
 
-# Conversation history for the drip attack (test #10)
-DRIP_HISTORY = [
-    {
-        "sender": "scammer",
-        "text": "Hello, I am calling from LIC of India regarding your policy.",
-        "timestamp": "2026-02-10T10:00:00Z",
-    },
-    {
-        "sender": "user",
-        "text": "Yes, I have a LIC policy. What about it?",
-        "timestamp": "2026-02-10T10:01:00Z",
-    },
-    {
-        "sender": "scammer",
-        "text": "Your policy has matured and you are eligible for Rs 8,00,000. "
-                "We just need to process the claim.",
-        "timestamp": "2026-02-10T10:02:00Z",
-    },
-    {
-        "sender": "user",
-        "text": "Oh that's great! What do I need to do?",
-        "timestamp": "2026-02-10T10:03:00Z",
-    },
-]
+
+def _scam_body(scam: AdversarialScam) -> bytes:
+    """Request JSON for one adversarial scam, encoded once at import."""
+    return orjson.dumps({
+        "sessionId": scam.session_id,
+        "message": {
+            "sender": "scammer",
+            "text": scam.text,
+            "timestamp": "2026-02-10T10:05:00Z",
+        },
+        "conversationHistory": scam.history,
+        "metadata": {
+            "channel": scam.channel,
+            "language": "English",
+            "locale": "IN",
+        },
+    })
+
+
+# The payloads never change between runs, so they are serialized up front
+ADVERSARIAL_BODIES = [_scam_body(scam) for scam in ADVERSARIAL_SCAMS]
+
+# Seconds before a still-pending request gets a duplicate sent. Well past a
+# normal Gemini turn, so only cold-start outliers are hedged; each check is
+# single-turn, so a repeated turn does not change the verdict.
+HEDGE_AFTER = 15
 
 
 def run() -> None:
@@ -136,28 +178,16 @@ def run() -> None:
     detected_count = 0
     total = len(ADVERSARIAL_SCAMS)
 
-    for i, (name, text) in enumerate(ADVERSARIAL_SCAMS):
+    # The requests are independent, so send them all at once; results are
+    # still recorded in scenario order.
+    responses = post_all(ADVERSARIAL_BODIES, hedge_after=HEDGE_AFTER)
+
+    for scam, response in zip(ADVERSARIAL_SCAMS, responses):
+        name = scam.name
         try:
-            body = {
-                "sessionId": f"adv-{name.lower().replace(' ', '-')[:30]}",
-                "message": {
-                    "sender": "scammer",
-                    "text": text,
-                    "timestamp": "2026-02-10T10:05:00Z",
-                },
-                "conversationHistory": [],
-                "metadata": {
-                    "channel": "SMS",
-                    "language": "English",
-                    "locale": "IN",
-                },
-            }
-            # Use drip history for the last scenario
-            if name.startswith("Drip"):
-                body["conversationHistory"] = DRIP_HISTORY
-                body["metadata"]["channel"] = "WhatsApp"
-
-            r, lat = post(body)
+            if isinstance(response, BaseException):
+                raise response
+            r, lat = response
             d = r.json()
             detected = d.get("scamDetected", False) is True
             if detected:
@@ -7,24 +7,23 @@ Run standalone:  python tests/test_auth.py
 
 import os
 import sys
-
-# ── Windows UTF-8 fix ────────────────────────────────────────────────────────
-os.environ["PYTHONIOENCODING"] = "utf-8"
-if sys.platform == "win32":
-    sys.stdout.reconfigure(encoding="utf-8", errors="replace")
-    sys.stderr.reconfigure(encoding="utf-8", errors="replace")
+from types import MappingProxyType
 
 # Allow running from project root or tests/ directory
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, os.path.dirname(__file__))
 
+import orjson  # noqa: E402
+
 from tests.helpers import (
     HEADERS,
     TIMEOUT_FAST,
     clear_results,
+    get_auth_ping,
     get_critical_failures,
     get_results,
     post,
+    post_all,
     post_raw,
     print_summary,
     record,
@@ -44,6 +43,44 @@ BODY_BASIC = {
     "conversationHistory": [],
     "metadata": {"channel": "SMS", "language": "English", "locale": "IN"},
 }
+# Sent several times below; encode it once
+_BODY_BASIC_JSON = orjson.dumps(BODY_BASIC)
+
+
+# ── Read-only template for the valid-body tests; copy, then set what varies ──
+_VALID_MESSAGE = MappingProxyType({
+    "sender": "scammer",
+    "text": "Your bank account is blocked. Share OTP.",
+    "timestamp": "",
+})
+_VALID_TEMPLATE = MappingProxyType({
+    "sessionId": "",
+    "message": _VALID_MESSAGE,
+    "conversationHistory": (),
+})
+_SHORT_TEXT = "Your account is blocked. Share OTP."
+
+
+def _valid_body(session_id, timestamp, text=None, **extra):
+    """A fresh request dict built from _VALID_TEMPLATE."""
+    message = {**_VALID_MESSAGE, "timestamp": timestamp}
+    if text is not None:
+        message["text"] = text
+    return {**_VALID_TEMPLATE, "sessionId": session_id, "message": message, **extra}
+
+
+# ── Timestamp formats the API must accept: (name, sessionId, timestamp) ──────
+TS_CASES = [
+    (name, f"ts-{name.replace(' ', '-').lower()}", ts_val)
+    for name, ts_val in (
+        ("ISO 8601 with Z", "2026-01-21T10:15:30Z"),
+        ("ISO 8601 with offset +05:30", "2026-01-21T10:15:30+05:30"),
+        ("ISO 8601 no timezone", "2026-01-21T10:15:30"),
+        ("Epoch ms (int)", 1737451530000),
+        ("Epoch ms (float)", 1737451530000.0),
+        ("Large epoch ms", 1800000000000),
+    )
+]
 
 
 def run() -> None:
@@ -58,7 +95,7 @@ def run() -> None:
     # 1. No API key
     r, lat = post_raw(
         {"Content-Type": "application/json"},
-        BODY_BASIC,
+        _BODY_BASIC_JSON,
     )
     record("No API key -> 401", r.status_code == 401, lat,
            f"Got {r.status_code}", "AUTH")
@@ -66,7 +103,7 @@ def run() -> None:
     # 2. Wrong API key
     r, lat = post_raw(
         {"Content-Type": "application/json", "x-api-key": "wrong-key-xyz"},
-        BODY_BASIC,
+        _BODY_BASIC_JSON,
     )
     record("Wrong API key -> 401", r.status_code == 401, lat,
            f"Got {r.status_code}", "AUTH")
@@ -74,27 +111,49 @@ def run() -> None:
     # 3. Empty API key
     r, lat = post_raw(
         {"Content-Type": "application/json", "x-api-key": ""},
-        BODY_BASIC,
+        _BODY_BASIC_JSON,
     )
     record("Empty API key -> 401", r.status_code == 401, lat,
            f"Got {r.status_code}", "AUTH")
 
-    # 4. Correct API key -> 200
-    r, lat = post(BODY_BASIC)
+    # 4. Correct API key -> 200 (auth-only route, no Gemini call)
+    r, lat = get_auth_ping()
     record("Correct API key -> 200", r.status_code == 200, lat,
            f"Got {r.status_code}", "AUTH")
 
+    # 5. /auth/ping rejects a missing or wrong key like /honeypot does
+    r, lat = get_auth_ping({})
+    record("Auth ping: no API key -> 401", r.status_code == 401, lat,
+           f"Got {r.status_code}", "AUTH")
+
+    r, lat = get_auth_ping({"x-api-key": "wrong-key-xyz"})
+    record("Auth ping: wrong API key -> 401", r.status_code == 401, lat,
+           f"Got {r.status_code}", "AUTH")
+
     # ==================================================================
     #  INPUT VALIDATION TESTS
     # ==================================================================
     section("INPUT VALIDATION TESTS")
 
-    # 5. Empty body -> 422
+    # 6. Empty body -> 422
     r, lat = post_raw(HEADERS, b"{}", TIMEOUT_FAST)
     record("Empty body -> 422", r.status_code == 422, lat,
            f"Got {r.status_code}", "VALIDATION")
 
-    # 6. Missing sessionId -> 422
+    # 7. Body that isn't valid UTF-8 -> 4xx (not a 500)
+    r, lat = post_raw(HEADERS, b"\xff\xfe{", TIMEOUT_FAST)
+    record("Invalid UTF-8 body -> 4xx", 400 <= r.status_code < 500, lat,
+           f"Got {r.status_code}", "VALIDATION")
+
+    # 8. Non-JSON Content-Type -> 422, even with a valid JSON body
+    r, lat = post_raw(
+        {"Content-Type": "text/plain", "x-api-key": HEADERS["x-api-key"]},
+        _BODY_BASIC_JSON,
+    )
+    record("text/plain Content-Type -> 422", r.status_code == 422, lat,
+           f"Got {r.status_code}", "VALIDATION")
+
+    # 9. Missing sessionId -> 422
     r, lat = post(
         {"message": {"sender": "scammer", "text": "test", "timestamp": "2026-01-21T10:15:30Z"}},
         timeout=TIMEOUT_FAST,
@@ -102,12 +161,12 @@ def run() -> None:
     record("Missing sessionId -> 422", r.status_code == 422, lat,
            f"Got {r.status_code}", "VALIDATION")
 
-    # 7. Missing message -> 422
+    # 10. Missing message -> 422
     r, lat = post({"sessionId": "test"}, timeout=TIMEOUT_FAST)
     record("Missing message -> 422", r.status_code == 422, lat,
            f"Got {r.status_code}", "VALIDATION")
 
-    # 8. Invalid sender "unknown" -> 422
+    # 11. Invalid sender "unknown" -> 422
     r, lat = post({
         "sessionId": "test",
         "message": {"sender": "unknown", "text": "hi", "timestamp": "2026-01-21T10:00:00Z"},
@@ -115,7 +174,7 @@ def run() -> None:
     record("Invalid sender 'unknown' -> 422", r.status_code == 422, lat,
            f"Got {r.status_code}", "VALIDATION")
 
-    # 9. Missing timestamp -> 422
+    # 12. Missing timestamp -> 422
     r, lat = post({
         "sessionId": "test",
         "message": {"sender": "scammer", "text": "hi"},
@@ -123,44 +182,26 @@ def run() -> None:
     record("Missing timestamp -> 422", r.status_code == 422, lat,
            f"Got {r.status_code}", "VALIDATION")
 
-    # 10. Empty conversationHistory -> 200 (OK)
-    r, lat = post({
-        "sessionId": "test-empty-hist",
-        "message": {
-            "sender": "scammer",
-            "text": "Your account is blocked. Share OTP.",
-            "timestamp": "2026-01-21T10:00:00Z",
-        },
-        "conversationHistory": [],
-    })
+    # 13. Empty conversationHistory -> 200 (OK)
+    r, lat = post(_valid_body(
+        "test-empty-hist", "2026-01-21T10:00:00Z", _SHORT_TEXT,
+    ))
     record("Empty conversationHistory -> 200", r.status_code == 200, lat,
            f"Got {r.status_code}", "VALIDATION")
 
-    # 11. No metadata field -> 200 (optional)
-    r, lat = post({
-        "sessionId": "test-no-meta",
-        "message": {
-            "sender": "scammer",
-            "text": "Your account is blocked. Share OTP.",
-            "timestamp": "2026-01-21T10:00:00Z",
-        },
-        "conversationHistory": [],
-    })
+    # 14. No metadata field -> 200 (optional)
+    r, lat = post(_valid_body(
+        "test-no-meta", "2026-01-21T10:00:00Z", _SHORT_TEXT,
+    ))
     record("No metadata -> 200", r.status_code == 200, lat,
            f"Got {r.status_code}", "VALIDATION")
 
-    # 12. Extra unknown fields ignored -> 200
-    r, lat = post({
-        "sessionId": "test-extra",
-        "message": {
-            "sender": "scammer",
-            "text": "Your account is blocked. Share OTP.",
-            "timestamp": "2026-01-21T10:00:00Z",
-        },
-        "conversationHistory": [],
-        "unknownField": "should be ignored",
-        "anotherField": 12345,
-    })
+    # 15. Extra unknown fields ignored -> 200
+    r, lat = post(_valid_body(
+        "test-extra", "2026-01-21T10:00:00Z", _SHORT_TEXT,
+        unknownField="should be ignored",
+        anotherField=12345,
+    ))
     record("Extra fields ignored -> 200", r.status_code == 200, lat,
            f"Got {r.status_code}", "VALIDATION")
 
@@ -169,26 +210,17 @@ def run() -> None:
     # ==================================================================
     section("TIMESTAMP FORMAT TESTS")
 
-    ts_cases = [
-        ("ISO 8601 with Z", "2026-01-21T10:15:30Z"),
-        ("ISO 8601 with offset +05:30", "2026-01-21T10:15:30+05:30"),
-        ("ISO 8601 no timezone", "2026-01-21T10:15:30"),
-        ("Epoch ms (int)", 1737451530000),
-        ("Epoch ms (float)", 1737451530000.0),
-        ("Large epoch ms", 1800000000000),
+    bodies = [
+        _valid_body(session_id, ts_val) for _, session_id, ts_val in TS_CASES
     ]
+    # Independent sessions, so the cases run concurrently; recorded in order.
+    responses = post_all(bodies)
 
-    for name, ts_val in ts_cases:
+    for (name, _, _), response in zip(TS_CASES, responses):
         try:
-            r, lat = post({
-                "sessionId": f"ts-{name.replace(' ', '-').lower()}",
-                "message": {
-                    "sender": "scammer",
-                    "text": "Your bank account is blocked. Share OTP.",
-                    "timestamp": ts_val,
-                },
-                "conversationHistory": [],
-            })
+            if isinstance(response, BaseException):
+                raise response
+            r, lat = response
             passed = r.status_code == 200
             record(f"Timestamp: {name} -> 200", passed, lat,
                    f"Got {r.status_code}", "TIMESTAMP")
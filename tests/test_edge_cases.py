@@ -11,12 +11,6 @@ Run standalone:  python tests/test_edge_cases.py
 import os
 import sys
 
-# ── Windows UTF-8 fix ────────────────────────────────────────────────────────
-os.environ["PYTHONIOENCODING"] = "utf-8"
-if sys.platform == "win32":
-    sys.stdout.reconfigure(encoding="utf-8", errors="replace")
-    sys.stderr.reconfigure(encoding="utf-8", errors="replace")
-
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, os.path.dirname(__file__))
 
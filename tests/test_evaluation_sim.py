@@ -16,16 +16,15 @@ import json
 import uuid
 from datetime import datetime, timezone
 
-os.environ["PYTHONIOENCODING"] = "utf-8"
-if sys.platform == "win32":
-    sys.stdout.reconfigure(encoding="utf-8", errors="replace")
-    sys.stderr.reconfigure(encoding="utf-8", errors="replace")
-
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, os.path.dirname(__file__))
 
 import httpx
 
+from tests.helpers import ensure_stdio
+
+ensure_stdio()
+
 BASE_URL = "http://localhost:8080"
 API_KEY = "TechjaysSuperSecret123!"
 HEADERS = {"Content-Type": "application/json", "x-api-key": API_KEY}
@@ -144,6 +143,11 @@ def evaluate_scenario(scenario):
         r, lat = post_honeypot(session_id, scammer_msg, conversation_history, scenario["metadata"])
         turn_latencies.append(lat)
 
+        # Only pause between turns when the server asks us to back off
+        retry_after = r.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            time.sleep(int(retry_after))
+
         if r.status_code != 200:
             print(f"  ERROR: Status {r.status_code} | {r.text[:100]}")
             continue
@@ -174,9 +178,6 @@ def evaluate_scenario(scenario):
             "timestamp": now_iso(),
         })
 
-        # Small delay between turns (evaluator has natural delays)
-        time.sleep(0.5)
-
     end_time = time.time()
     total_duration = int(end_time - start_time)
     total_messages = len(conversation_history)
@@ -0,0 +1,105 @@
+"""
+Offline tests for the hedged-request helper (helpers.async_post_hedged).
+Drives it through an httpx.MockTransport with scripted per-attempt delays
+and failures, so no server is needed.
+
+Run standalone:  python tests/test_hedging.py
+"""
+
+import asyncio
+import gc
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.dirname(__file__))
+
+import httpx  # noqa: E402
+
+from tests.helpers import (  # noqa: E402
+    async_post_hedged,
+    clear_results,
+    get_critical_failures,
+    get_results,
+    print_summary,
+    record,
+    section,
+)
+
+HEDGE_AFTER = 0.1  # seconds
+
+# (name, per-attempt (delay_s, ok) script, expected winning attempt or None
+# if the call should raise, expected number of attempts sent)
+CASES = [
+    ("Fast success, no hedge", [(0.01, True)], 1, 1),
+    ("Hedge wins over slow original", [(1.0, True), (0.01, True)], 2, 2),
+    ("Original fails, hedge succeeds", [(0.3, False), (0.4, True)], 2, 2),
+    ("Both attempts fail", [(0.3, False), (0.2, False)], None, 2),
+]
+
+
+async def _run_case(script):
+    """Run one hedged POST against *script*.
+
+    Returns (winning attempt or None, attempts sent, latency_ms, unretrieved
+    task exceptions reported to the loop).
+    """
+    attempts = 0
+    loop_errors = []
+    asyncio.get_running_loop().set_exception_handler(
+        lambda _loop, ctx: loop_errors.append(ctx.get("message", "")),
+    )
+
+    async def handler(request):
+        nonlocal attempts
+        attempts += 1
+        attempt = attempts
+        delay, ok = script[attempt - 1]
+        await asyncio.sleep(delay)
+        if not ok:
+            raise httpx.ConnectError(f"attempt {attempt} failed", request=request)
+        return httpx.Response(200, json={"attempt": attempt})
+
+    winner, lat = None, 0
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        try:
+            r, lat = await async_post_hedged(client, {"sessionId": "hedge"}, HEDGE_AFTER)
+            winner = r.json()["attempt"]
+        except httpx.ConnectError:
+            pass
+    # Let cancelled losers finish, then collect them so any exception that
+    # was never retrieved is reported now rather than at interpreter exit.
+    await asyncio.sleep(0.05)
+    gc.collect()
+    return winner, attempts, lat, loop_errors
+
+
+def run() -> None:
+    """Execute all hedged-request tests."""
+    clear_results()
+
+    section("HEDGED REQUEST TESTS (offline)")
+
+    for name, script, expected_winner, expected_attempts in CASES:
+        winner, attempts, lat, loop_errors = asyncio.run(_run_case(script))
+        record(
+            f"Hedge: {name}",
+            winner == expected_winner and attempts == expected_attempts,
+            lat,
+            f"winner={winner} (expected {expected_winner}), "
+            f"attempts={attempts} (expected {expected_attempts})",
+            "HEDGING",
+        )
+        record(
+            f"Hedge: {name} [no leaked task errors]",
+            not loop_errors,
+            lat,
+            "; ".join(loop_errors) or "All task exceptions retrieved",
+            "HEDGING",
+        )
+
+    print_summary(get_results(), get_critical_failures(), "HEDGED REQUEST REPORT")
+
+
+if __name__ == "__main__":
+    run()